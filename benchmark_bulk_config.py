@@ -0,0 +1,73 @@
+"""
+Compare bulk_transform_configs against the per-call config helpers.
+
+Generates configs for PROJECTS projects of a SERVICES-service template, overriding the repo,
+name and serverless mode of every service, once by deep-copying the template per project and
+calling update_service_repo / update_service_name / enable_serverless per service, and once with
+a single bulk_transform_configs call.
+
+Usage: python benchmark_bulk_config.py [projects] [services]
+"""
+import copy
+import sys
+import time
+from utils import update_service_repo, update_service_name, enable_serverless, bulk_transform_configs
+
+def make_template(services):
+    return {'services': {
+        f'template-service-{i}': {
+            'name': f'service-{i}',
+            'icon': 'https://example.com/icon.svg',
+            'source': {'repo': f'example/service-{i}', 'rootDirectory': '/'},
+            'variables': {f'VAR_{j}': {'defaultValue': str(j)} for j in range(10)},
+            'deploy': {'startCommand': 'npm start'}
+        }
+        for i in range(services)
+    }}
+
+def make_overrides(projects, services):
+    return [
+        {
+            'project': f'project-{p}',
+            'service': f'service-{s}',
+            'repo': f'customer-{p}/service-{s}',
+            'name': f'project-{p}-service-{s}',
+            'serverless': s % 2 == 0
+        }
+        for p in range(projects)
+        for s in range(services)
+    ]
+
+def per_call(template, overrides):
+    configs = {}
+    for row in overrides:
+        if row['project'] not in configs:
+            configs[row['project']] = copy.deepcopy(template)
+        config = configs[row['project']]
+        update_service_repo(config, row['service'], row['repo'])
+        if row['serverless']:
+            enable_serverless(config, row['service'])
+        update_service_name(config, row['service'], row['name'])
+    return configs
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+if __name__ == '__main__':
+    projects = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    services = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    template = make_template(services)
+    overrides = make_overrides(projects, services)
+
+    per_call_configs, per_call_time = timed(per_call, template, overrides)
+    bulk_configs, bulk_time = timed(bulk_transform_configs, template, overrides)
+
+    if per_call_configs != bulk_configs:
+        raise Exception("Bulk configs do not match the per-call configs")
+
+    print(f"{projects} projects x {services} services")
+    print(f"per-call helpers: {per_call_time:.3f}s")
+    print(f"bulk transform:   {bulk_time:.3f}s ({per_call_time / bulk_time:.1f}x faster)")
@@ -0,0 +1,79 @@
+"""
+Compare polling and event-driven completion for deploy_template and wait_for_services.
+
+Runs against a simulated Railway API: a fake client counts requests while a background
+thread advances the workflow and service deployments and emits events to a local receiver.
+
+Usage: python benchmark_events.py
+"""
+import threading
+import time
+from deploy_template import deploy_template
+from deployment_events import DeploymentEventReceiver, emit_deployment_status
+from utils import wait_for_services
+
+PROJECT_ID = 'project-1'
+WORKFLOW_ID = 'workflow-1'
+SERVICE_IDS = [f'template-service-{i}' for i in range(5)]
+READY_AFTER = 4.5
+
+class SimulatedClient:
+    """Fake GraphQL client that answers the queries used while waiting on a deploy"""
+
+    def __init__(self):
+        self.requests = 0
+        self.ready = threading.Event()
+
+    def execute(self, document, variable_values=None):
+        self.requests += 1
+        operation = document.definitions[0].name.value
+
+        if operation == 'DeployTemplate':
+            return {'templateDeployV2': {'projectId': PROJECT_ID, 'workflowId': WORKFLOW_ID}}
+
+        if operation == 'workflowStatus':
+            status = 'Complete' if self.ready.is_set() else 'Running'
+            return {'workflowStatus': {'status': status, 'error': None}}
+
+        status = 'BUILDING' if self.ready.is_set() else None
+        return {'project': {'services': {'edges': [
+            {'node': {
+                'id': f'service-{template_id}',
+                'templateServiceId': template_id,
+                'deployments': {'edges': [{'node': {'status': status}}] if status else []}
+            }}
+            for template_id in SERVICE_IDS
+        ]}}}
+
+def simulate_deployment(client, receiver):
+    time.sleep(READY_AFTER)
+    client.ready.set()
+    if receiver is not None:
+        # Only Railway webhook-shaped payloads, which carry project and service IDs but no workflow ID
+        for template_id in SERVICE_IDS:
+            emit_deployment_status(receiver.url, 'BUILDING', project_id=PROJECT_ID, service_id=f'service-{template_id}')
+
+def run(receiver=None):
+    client = SimulatedClient()
+    serialized_config = {'services': {template_id: {'name': template_id} for template_id in SERVICE_IDS}}
+
+    start = time.perf_counter()
+    simulation = threading.Thread(target=simulate_deployment, args=(client, receiver))
+    simulation.start()
+
+    deploy_template(client, serialized_config, 'template', PROJECT_ID, 'environment', 'team', event_receiver=receiver)
+    wait_for_services(client, PROJECT_ID, serialized_config, event_receiver=receiver)
+
+    latency = time.perf_counter() - start - READY_AFTER
+    simulation.join()
+    return client.requests, latency
+
+if __name__ == '__main__':
+    polling_requests, polling_latency = run()
+
+    with DeploymentEventReceiver() as receiver:
+        event_requests, event_latency = run(receiver)
+
+    print(f"\n{'mode':<8} {'requests':>9} {'time-to-ready (s)':>18}")
+    print(f"{'polling':<8} {polling_requests:>9} {polling_latency:>18.3f}")
+    print(f"{'events':<8} {event_requests:>9} {event_latency:>18.3f}")
@@ -1,5 +1,5 @@
 from gql import gql
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import time
 from workflow_status import get_workflow_status
 
@@ -18,7 +18,9 @@ def deploy_template(
     template_id: str,
     project_id: str,
     environment_id: str,
-    team_id: str
+    team_id: str,
+    event_receiver: Optional[Any] = None,
+    fallback_interval: float = 30
 ) -> Dict:
     """
     Deploy a template to Railway
@@ -30,6 +32,8 @@ def deploy_template(
         project_id (str): ID of the project to deploy to
         environment_id (str): ID of the environment to deploy to
         team_id (str): ID of the team to deploy under
+        event_receiver (DeploymentEventReceiver, optional): Receiver to wait on for workflow or project events instead of polling every second
+        fallback_interval (float): Seconds between status polls when waiting on events
         
     Returns:
         Dict: Deployment result containing project ID
@@ -47,17 +51,30 @@ def deploy_template(
     result = client.execute(deploy_mutation, variable_values=deploy_input)['templateDeployV2']
 
     while True:
-        workflow_status = get_workflow_status(
-            client=client,
-            workflow_id=result['workflowId']
-        )
+        # Register before polling so an event arriving in between is not missed
+        # Railway webhooks carry the project ID rather than the workflow ID, so wake on either
+        if event_receiver is not None:
+            workflow_event = event_receiver.expect(result['workflowId'], project_id)
 
-        if workflow_status['status'] == 'Complete':
-            break
+        try:
+            workflow_status = get_workflow_status(
+                client=client,
+                workflow_id=result['workflowId']
+            )
 
-        if workflow_status['error'] != None:
-            raise Exception(f"Deployment failed: {workflow_status['error']}")
+            if workflow_status['status'] == 'Complete':
+                break
 
-        time.sleep(1)
+            if workflow_status['error'] != None:
+                raise Exception(f"Deployment failed: {workflow_status['error']}")
+
+            if event_receiver is not None:
+                event_receiver.wait_for(workflow_event, fallback_interval)
+            else:
+                time.sleep(1)
+        finally:
+            # Don't leave a dead waiter behind on a shared receiver, whether we break, raise or loop
+            if event_receiver is not None:
+                event_receiver.discard(workflow_event)
 
     return result
\ No newline at end of file
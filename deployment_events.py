@@ -0,0 +1,239 @@
+import hmac
+import json
+import threading
+from concurrent.futures import CancelledError, Future, InvalidStateError, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+import requests
+
+class DeploymentEventReceiver:
+    """
+    Local HTTP receiver for deployment status events (e.g. Railway webhooks)
+
+    Waiters register interest in one or more keys (workflow ID, service ID or project ID)
+    with expect() and get back a Future that resolves with the next event carrying any of them.
+    Events are only used as a wake-up signal; callers should still confirm the state
+    through the API, so a missed or reordered event costs at most one fallback poll.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, token: Optional[str] = None):
+        """
+        Args:
+            host (str): Interface to listen on
+            port (int): Port to listen on, 0 picks a free port
+            token (str, optional): Secret path segment events must be POSTed to, set this
+                whenever the receiver is reachable from outside the machine
+        """
+        self._path = f"/{token}" if token else "/"
+        self._lock = threading.Lock()
+        self._waiters: Dict[str, List[Future]] = {}
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """The URL events should be POSTed to"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self._path}"
+
+    def start(self) -> 'DeploymentEventReceiver':
+        """Start serving in a background thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release any outstanding waiters so they fall back to polling"""
+        # shutdown() waits for serve_forever() to exit, which never runs if start() wasn't called
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+        with self._lock:
+            waiters, self._waiters = self._waiters, {}
+        for futures in waiters.values():
+            for future in futures:
+                future.cancel()
+
+    def __enter__(self) -> 'DeploymentEventReceiver':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def expect(self, *keys: str) -> Future:
+        """
+        Get a Future that resolves with the next event for any of the given keys
+
+        Register before checking the current state to avoid missing an event
+        that arrives in between.
+
+        Args:
+            *keys (str): Workflow, service or project IDs to wait for
+
+        Returns:
+            Future: Resolves with the event payload
+        """
+        future = Future()
+        with self._lock:
+            for key in keys:
+                self._waiters.setdefault(key, []).append(future)
+        return future
+
+    def wait(self, *keys: str, timeout: float) -> Optional[Dict]:
+        """
+        Block until an event for any of the given keys arrives or the timeout expires
+
+        Args:
+            *keys (str): Workflow, service or project IDs to wait for
+            timeout (float): Maximum number of seconds to wait
+
+        Returns:
+            Dict: The event payload, or None if the timeout expired
+        """
+        return self.wait_for(self.expect(*keys), timeout)
+
+    def wait_for(self, future: Future, timeout: float) -> Optional[Dict]:
+        """
+        Block on a Future obtained from expect() for at most timeout seconds
+
+        Args:
+            future (Future): The Future returned by expect()
+            timeout (float): Maximum number of seconds to wait
+
+        Returns:
+            Dict: The event payload, or None if the timeout expired or the receiver was stopped
+        """
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self.discard(future)
+            return None
+        except CancelledError:
+            return None
+
+    def publish(self, event: Dict) -> int:
+        """
+        Resolve all waiters for the keys carried by an event
+
+        Args:
+            event (Dict): The event payload
+
+        Returns:
+            int: Number of waiters resolved
+        """
+        resolved = 0
+        with self._lock:
+            futures = [future for key in get_event_keys(event) for future in self._waiters.pop(key, [])]
+
+        # A Future registered under several keys is only resolved once
+        for future in dict.fromkeys(futures):
+            self.discard(future)
+            try:
+                future.set_result(event)
+                resolved += 1
+            except InvalidStateError:
+                pass
+        return resolved
+
+    def discard(self, future: Future) -> None:
+        """
+        Stop waiting on a Future obtained from expect()
+
+        Args:
+            future (Future): The Future returned by expect()
+        """
+        with self._lock:
+            for key in list(self._waiters):
+                futures = [waiter for waiter in self._waiters[key] if waiter is not future]
+                if futures:
+                    self._waiters[key] = futures
+                else:
+                    del self._waiters[key]
+
+    def _make_handler(self):
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if not hmac.compare_digest(self.path.encode(), receiver._path.encode()):
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+
+                try:
+                    length = int(self.headers.get('Content-Length', 0))
+                    event = json.loads(self.rfile.read(length) or b'{}')
+                except ValueError:
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+
+                if isinstance(event, dict):
+                    receiver.publish(event)
+
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+def get_event_keys(event: Dict) -> List[str]:
+    """
+    Get the workflow, service and project IDs carried by a deployment event
+
+    Accepts both flat payloads ({"workflowId": ..., "serviceId": ...}) and
+    Railway webhook payloads ({"service": {"id": ...}, "project": {"id": ...}}).
+
+    Args:
+        event (Dict): The event payload
+
+    Returns:
+        List[str]: IDs found in the event
+    """
+    keys = []
+    for name in ('workflow', 'service', 'project'):
+        value = event.get(f'{name}Id')
+        if value is None and isinstance(event.get(name), dict):
+            value = event[name].get('id')
+        if value is not None:
+            keys.append(value)
+    return keys
+
+def emit_event(url: str, event: Dict) -> None:
+    """
+    POST a deployment event to a receiver, for local testing
+
+    Args:
+        url (str): The receiver URL
+        event (Dict): The event payload
+    """
+    response = requests.post(url, json=event, timeout=5)
+    response.raise_for_status()
+
+def emit_deployment_status(
+    url: str,
+    status: str,
+    project_id: Optional[str] = None,
+    service_id: Optional[str] = None
+) -> None:
+    """
+    POST a Railway-style deployment status event to a receiver, for local testing
+
+    Args:
+        url (str): The receiver URL
+        status (str): Deployment status, e.g. "BUILDING" or "SUCCESS"
+        project_id (str, optional): ID of the project
+        service_id (str, optional): ID of the service
+    """
+    event: Dict[str, Any] = {"type": "DEPLOY", "status": status}
+    if project_id is not None:
+        event['project'] = {"id": project_id}
+    if service_id is not None:
+        event['service'] = {"id": service_id}
+
+    emit_event(url, event)
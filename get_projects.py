@@ -0,0 +1,38 @@
+from gql import gql
+from typing import Dict, Any, List
+
+projects_query = gql("""
+    query projects($teamId: String) {
+        projects(teamId: $teamId) {
+            edges {
+                node {
+                    id
+                    name
+                    description
+                    createdAt
+                    environments(first: 1) {
+                        edges {
+                            node {
+                                id
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+""")
+
+def get_projects(client: Any, team_id: str = None) -> List[Dict]:
+    """
+    Get projects from Railway
+    
+    Args:
+        client: The GraphQL client
+        team_id (str, optional): Team ID to list projects for, personal projects if not set
+        
+    Returns:
+        List[Dict]: List of projects with their IDs, names, descriptions, creation times and environment IDs
+    """
+    result = client.execute(projects_query, variable_values={"teamId": team_id})
+    return [edge['node'] for edge in result['projects']['edges']]
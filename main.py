@@ -59,8 +59,26 @@ try:
 
     print("Repository URLs updated!")
 
+    # Example (Optional) - Generate configs for many projects at once from a table of overrides
+    # Run this after the repository URL update above, later changes to serialized_config do not affect the results
+    # Services without overrides are shared between the returned configs and are deliberately plain dicts rather than
+    # frozen ones, so they stay JSON serializable; do not modify the returned configs in place
+    # Overridden repos keep the same full GitHub URL form, pass github_repos to also use their default branches
+    # from utils import bulk_transform_configs
+    # project_configs = bulk_transform_configs(serialized_config, [
+    #     {"project": "panera", "service": "panera-bread", "repo": "brody192/302-redir", "serverless": True},
+    #     {"project": "subway", "service": "panera-bread", "name": "subway", "branch": "dev"},
+    # ], github_repos=get_available_github_repos(client))
+
     print("Creating project...")
 
+    # Example (Optional) - Claim a pre-created project from a warm pool instead of creating one
+    # In a long-running service, enter the pool once at startup so it is already filled when requests arrive
+    # Leaving the block deletes the unclaimed projects, and a later start adopts any left behind by a crash
+    # from project_pool import ProjectPool
+    # with ProjectPool(client, team_id=os.getenv("RAILWAY_TEAM_ID", None), low_water=2, high_water=5) as project_pool:
+    #     project_result = project_pool.claim(name="Panera Project", description="A project for Panera Bread redirect service")
+
     # Create the project
     project_result = create_project(
         client=client,
@@ -76,6 +94,14 @@ try:
 
     print("Deploying Template...")
 
+    # Example (Optional) - Wait on deployment events instead of polling every second
+    # Point a Railway project webhook at event_receiver.url (e.g. through a tunnel) and pass
+    # event_receiver=event_receiver to deploy_template and wait_for_services below
+    # Always set a secret token when listening on a public interface, otherwise anyone who can
+    # reach the port can trigger Railway API polls made with your token
+    # from deployment_events import DeploymentEventReceiver
+    # event_receiver = DeploymentEventReceiver(host="0.0.0.0", port=8080, token=os.getenv("EVENT_RECEIVER_TOKEN")).start()
+
     # Deploy the template
     deploy_result = deploy_template(
         client=client,
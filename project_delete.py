@@ -0,0 +1,22 @@
+from gql import gql
+from typing import Any
+
+project_delete_mutation = gql("""
+    mutation DeleteProject($id: String!) {
+        projectDelete(id: $id)
+    }
+""")
+
+def delete_project(client: Any, project_id: str) -> bool:
+    """
+    Delete a project in Railway
+    
+    Args:
+        client: The GraphQL client
+        project_id (str): ID of the project to delete
+        
+    Returns:
+        bool: Whether the project was deleted
+    """
+    result = client.execute(project_delete_mutation, variable_values={"id": project_id})
+    return result['projectDelete']
@@ -0,0 +1,219 @@
+import atexit
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+from project_create import create_project
+from project_update import update_project
+from project_delete import delete_project
+from get_projects import get_projects
+
+class ProjectPool:
+    """
+    Pool of pre-created projects that can be claimed instead of creating one on demand
+
+    A background thread keeps between low_water and high_water projects ready, refilling
+    to high_water whenever the pool drops to low_water, and deletes pooled projects
+    older than max_age seconds. Claimed projects are renamed and described in place and
+    keep the environment IDs fetched when they were created, so they can be passed
+    straight to deploy_template.
+
+    Pooled projects are recognised by their placeholder name and description. On start the
+    pool adopts matching projects left behind by earlier runs and deletes the stale ones,
+    and unclaimed projects are deleted on stop() or at interpreter exit. Pools sharing an
+    account must use distinct placeholder names so they don't adopt each other's projects.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        team_id: Optional[str] = None,
+        low_water: int = 2,
+        high_water: int = 5,
+        max_age: float = 3600,
+        refill_interval: float = 60,
+        placeholder_name: str = "warm-pool",
+        placeholder_description: str = "Pre-created project awaiting claim"
+    ):
+        """
+        Args:
+            client: The GraphQL client
+            team_id (str, optional): Team ID to create the projects under
+            low_water (int): Pool size at or below which a refill is started
+            high_water (int): Pool size a refill fills up to
+            max_age (float): Seconds after which an unclaimed project is deleted
+            refill_interval (float): Seconds between background checks for stale entries
+            placeholder_name (str): Name given to projects while they are in the pool
+            placeholder_description (str): Description given to projects while they are in the pool
+
+        Raises:
+            ValueError: If the water marks are invalid
+        """
+        if low_water < 0 or high_water <= low_water:
+            raise ValueError("Water marks must satisfy 0 <= low_water < high_water")
+
+        self.client = client
+        self.team_id = team_id
+        self.low_water = low_water
+        self.high_water = high_water
+        self.max_age = max_age
+        self.refill_interval = refill_interval
+        self.placeholder_name = placeholder_name
+        self.placeholder_description = placeholder_description
+
+        # Entries are (created_at, project) tuples, oldest first
+        self._projects = deque()
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._projects)
+
+    def start(self) -> 'ProjectPool':
+        """Start refilling the pool in a background thread"""
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+        return self
+
+    def stop(self, delete_unclaimed: bool = True) -> None:
+        """
+        Stop refilling the pool, registered to run at interpreter exit by start()
+
+        Args:
+            delete_unclaimed (bool): Whether to delete the projects still in the pool
+        """
+        atexit.unregister(self.stop)
+        self._stopped.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        if delete_unclaimed:
+            with self._condition:
+                entries, self._projects = list(self._projects), deque()
+            for _, project in entries:
+                self._delete(project)
+
+    def __enter__(self) -> 'ProjectPool':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def claim(self, name: str, description: str) -> Dict:
+        """
+        Claim a pre-created project, falling back to creating one if the pool is empty
+
+        Args:
+            name (str): Name of the project
+            description (str): Project description
+
+        Returns:
+            Dict: Project result containing project and environment IDs, as returned by create_project
+        """
+        project = None
+        now = time.monotonic()
+        with self._condition:
+            # Take the oldest fresh entry, stale ones are left for the refill thread to delete
+            for index, (created_at, candidate) in enumerate(self._projects):
+                if now - created_at <= self.max_age:
+                    del self._projects[index]
+                    project = candidate
+                    break
+
+            if len(self._projects) <= self.low_water:
+                self._condition.notify_all()
+
+        if project is None:
+            return create_project(client=self.client, name=name, description=description, team_id=self.team_id)
+
+        try:
+            updated = update_project(client=self.client, project_id=project['id'], name=name, description=description)
+        except Exception:
+            # The project has left the pool, delete it rather than leaking it under the placeholder name
+            self._delete(project)
+            raise
+
+        return {**project, 'name': updated['name']}
+
+    def _run(self) -> None:
+        try:
+            self._adopt()
+        except Exception as e:
+            print(f"Project pool failed to adopt existing projects: {str(e)}")
+
+        while not self._stopped.is_set():
+            try:
+                self._prune()
+                self._refill()
+            except Exception as e:
+                print(f"Project pool refill failed: {str(e)}")
+
+            with self._condition:
+                if len(self._projects) > self.low_water and not self._stopped.is_set():
+                    self._condition.wait(timeout=self.refill_interval)
+                elif not self._stopped.is_set():
+                    # Back off briefly after a failed refill instead of spinning
+                    self._condition.wait(timeout=min(self.refill_interval, 5))
+
+    def _adopt(self) -> None:
+        now = datetime.now(timezone.utc)
+        unwanted = []
+        for project in get_projects(client=self.client, team_id=self.team_id):
+            if project['name'] != self.placeholder_name or project['description'] != self.placeholder_description:
+                continue
+
+            age = (now - datetime.fromisoformat(project['createdAt'].replace('Z', '+00:00'))).total_seconds()
+            with self._condition:
+                if age <= self.max_age and len(self._projects) < self.high_water:
+                    self._projects.append((time.monotonic() - age, project))
+                    continue
+            unwanted.append(project)
+
+        with self._condition:
+            self._projects = deque(sorted(self._projects, key=lambda entry: entry[0]))
+
+        for project in unwanted:
+            self._delete(project)
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        with self._condition:
+            stale = [project for created_at, project in self._projects if now - created_at > self.max_age]
+            self._projects = deque(entry for entry in self._projects if now - entry[0] <= self.max_age)
+
+        for project in stale:
+            self._delete(project)
+
+    def _refill(self) -> None:
+        with self._condition:
+            if len(self._projects) > self.low_water:
+                return
+
+        while not self._stopped.is_set():
+            with self._condition:
+                if len(self._projects) >= self.high_water:
+                    return
+
+            project = create_project(
+                client=self.client,
+                name=self.placeholder_name,
+                description=self.placeholder_description,
+                team_id=self.team_id
+            )
+
+            with self._condition:
+                self._projects.append((time.monotonic(), project))
+
+    def _delete(self, project: Dict) -> None:
+        try:
+            delete_project(client=self.client, project_id=project['id'])
+        except Exception as e:
+            print(f"Failed to delete pooled project {project['id']}: {str(e)}")
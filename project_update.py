@@ -0,0 +1,36 @@
+from gql import gql
+from typing import Dict, Any
+
+project_update_mutation = gql("""
+    mutation UpdateProject($id: String!, $input: ProjectUpdateInput!) {
+        projectUpdate(id: $id, input: $input) {
+            id
+            name
+            description
+        }
+    }
+""")
+
+def update_project(client: Any, project_id: str, name: str, description: str) -> Dict:
+    """
+    Update the name and description of a project in Railway
+    
+    Args:
+        client: The GraphQL client
+        project_id (str): ID of the project to update
+        name (str): New name of the project
+        description (str): New project description
+        
+    Returns:
+        Dict: Project update result containing the project ID, name and description
+    """
+    project_input = {
+        "id": project_id,
+        "input": {
+            "name": name,
+            "description": description
+        }
+    }
+    
+    result = client.execute(project_update_mutation, variable_values=project_input)
+    return result['projectUpdate']
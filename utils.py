@@ -115,6 +115,23 @@ def get_all_service_names(serialized_config):
             for service_info in serialized_config['services'].values() 
             if service_info.get('name') is not None]
 
+def get_default_branch(repo_name, github_repos):
+    """
+    Get the default branch of a repository from the available GitHub repositories.
+    
+    Args:
+        repo_name (str): The repository name, e.g. "owner/repo"
+        github_repos (list): List of GitHub repositories with their details
+    
+    Returns:
+        str: The repository's default branch, or 'main' if it is not found
+    """
+    for repo in github_repos:
+        if repo['fullName'] in repo_name:
+            return repo['defaultBranch']
+    
+    return 'main'
+
 def update_repo_urls_to_default_branch(serialized_config, github_repos):
     """
     Update all repository URLs to use the full GitHub URL format with the default branch
@@ -131,12 +148,7 @@ def update_repo_urls_to_default_branch(serialized_config, github_repos):
         if 'source' in service_info and 'repo' in service_info['source']:
             current_repo = service_info['source']['repo']
             
-            # Find matching repo in github_repos
-            default_branch = 'main'  # Default fallback
-            for repo in github_repos:
-                if repo['fullName'] in current_repo:
-                    default_branch = repo['defaultBranch']
-                    break
+            default_branch = get_default_branch(current_repo, github_repos)
             
             # Set branch to default branch
             service_info['source']['branch'] = default_branch
@@ -161,7 +173,7 @@ def get_repo_service_ids(serialized_config):
             for service_id, service_info in serialized_config['services'].items()
             if 'source' in service_info and 'repo' in service_info['source']]
 
-def wait_for_services(client, project_id, serialized_config):
+def wait_for_services(client, project_id, serialized_config, event_receiver=None, fallback_interval=30):
     """
     Wait for all services to exist and have deployment status set.
     
@@ -169,6 +181,8 @@ def wait_for_services(client, project_id, serialized_config):
         client: The Railway client instance
         project_id (str): The ID of the project
         serialized_config (dict): The template's serialized configuration
+        event_receiver (DeploymentEventReceiver, optional): Receiver to wait on for deployment events instead of polling every second
+        fallback_interval (float): Seconds between project polls when waiting on events
         
     Returns:
         list: Array of template services that have been deployed
@@ -179,23 +193,151 @@ def wait_for_services(client, project_id, serialized_config):
     template_services = []
     
     while True:
-        template_services = get_project_services_from_template(client, project_id, serialized_config)
+        # Register before polling so an event arriving in between is not missed
+        if event_receiver is not None:
+            project_event = event_receiver.expect(project_id)
+
+        try:
+            template_services = get_project_services_from_template(client, project_id, serialized_config)
+            
+            # Get the expected service IDs from serialized_config
+            expected_service_ids = set(serialized_config['services'].keys())
+            
+            # Count services that have a deployment status set and match the expected IDs
+            services_with_status = sum(
+                1 for service in template_services 
+                if service['templateServiceId'] in expected_service_ids and
+                service['deployments']['edges'] and 
+                service['deployments']['edges'][0]['node']['status'] is not None
+            )
+            
+            if services_with_status == len(expected_service_ids):
+                break
+                
+            if event_receiver is not None:
+                event_receiver.wait_for(project_event, fallback_interval)
+            else:
+                time.sleep(1)
+        finally:
+            # Don't leave a dead waiter behind on a shared receiver, whether we break, raise or loop
+            if event_receiver is not None:
+                event_receiver.discard(project_event)
+    
+    print("All services have started to deploy!")
+    return template_services
+
+def bulk_transform_configs(serialized_config, overrides, github_repos=None):
+    """
+    Generate per-project serialized configs from a table of service overrides in a single pass.
+    
+    Each override row targets one service of one project by its name in the base config and may set
+    any of 'repo', 'name', 'serverless' and 'branch'. The base config is copied once, so later changes
+    to it do not leak into the results, but services without overrides are then shared between the
+    returned configs rather than copied per project. They are plain dicts, not frozen, so the configs
+    stay JSON serializable for the GraphQL client; do not modify them in place, for example with
+    update_repo_urls_to_default_branch, and pass github_repos instead to get the same full GitHub URL
+    form for every repo-based service.
+    
+    Args:
+        serialized_config (dict): The template's serialized configuration
+        overrides (list or dict): Either a list of records, e.g.
+            [{'project': 'acme', 'service': 'hello-world', 'repo': 'acme/site', 'serverless': True}],
+            or the same table in columnar form, e.g.
+            {'project': ['acme', ...], 'service': ['hello-world', ...], 'repo': ['acme/site', ...]}
+            where None in a column means no override for that row
+        github_repos (list, optional): List of GitHub repositories with their details, to convert
+            repository URLs to the default branch form as update_repo_urls_to_default_branch does
+    
+    Returns:
+        dict: Mapping of project key to its serialized config
         
-        # Get the expected service IDs from serialized_config
-        expected_service_ids = set(serialized_config['services'].keys())
+    Raises:
+        ValueError: If the override columns differ in length, a service is not found or a repo or branch override targets a service without a repository configuration
+    """
+    import copy
+    
+    if isinstance(overrides, dict):
+        if len({len(column) for column in overrides.values()}) > 1:
+            raise ValueError("Override columns must all have the same length")
+        columns = list(overrides.keys())
+        overrides = [dict(zip(columns, row)) for row in zip(*overrides.values())]
+    
+    # Index services by name once instead of re-walking the services map per override
+    service_ids_by_name = {}
+    for service_id, service_info in serialized_config['services'].items():
+        if service_info.get('name') is not None:
+            service_ids_by_name.setdefault(service_info['name'], service_id)
+    
+    # Group overrides by project, merging repeated rows for the same service
+    project_overrides = {}
+    not_found = []
+    for row in overrides:
+        service_id = service_ids_by_name.get(row['service'])
+        if service_id is None:
+            not_found.append(row['service'])
+            continue
         
-        # Count services that have a deployment status set and match the expected IDs
-        services_with_status = sum(
-            1 for service in template_services 
-            if service['templateServiceId'] in expected_service_ids and
-            service['deployments']['edges'] and 
-            service['deployments']['edges'][0]['node']['status'] is not None
-        )
+        service_overrides = project_overrides.setdefault(row['project'], {}).setdefault(service_id, {})
+        for field in ('repo', 'name', 'serverless', 'branch'):
+            if row.get(field) is not None:
+                service_overrides[field] = row[field]
+    
+    if not_found:
+        raise ValueError(f"Services not found in config: {', '.join(dict.fromkeys(not_found))}")
+    
+    # Convert the base services to the default branch form once, shared by every project
+    base_config = copy.deepcopy(serialized_config)
+    base_services = base_config['services']
+    if github_repos is not None:
+        for service_id, service_info in base_services.items():
+            if 'source' in service_info and 'repo' in service_info['source']:
+                repo = service_info['source'].get('ogRepo', service_info['source']['repo'])
+                source = dict(service_info['source'])
+                source['branch'] = get_default_branch(repo, github_repos)
+                source['repo'] = f'https://github.com/{repo}/{source["branch"]}'
+                source['ogRepo'] = repo
+                base_services[service_id] = {**service_info, 'source': source}
+    
+    configs = {}
+    for project, services_overrides in project_overrides.items():
+        services = dict(base_services)
         
-        if services_with_status == len(expected_service_ids):
-            break
+        for service_id, service_overrides in services_overrides.items():
+            service_info = dict(services[service_id])
+            
+            if 'repo' in service_overrides or 'branch' in service_overrides:
+                if not ('source' in service_info and 'repo' in service_info['source']):
+                    raise ValueError(f"Service '{service_info.get('name')}' exists but does not have a repository configuration")
+                service_info['source'] = dict(service_info['source'])
+                source = service_info['source']
+                
+                if 'ogRepo' in source:
+                    # Keep the full GitHub URL form, with ogRepo pointing at the repository triggers are created on
+                    repo = service_overrides.get('repo', source['ogRepo'])
+                    if 'branch' in service_overrides:
+                        branch = service_overrides['branch']
+                    elif 'repo' in service_overrides and github_repos is not None:
+                        branch = get_default_branch(repo, github_repos)
+                    else:
+                        branch = source.get('branch', 'main')
+                    source['branch'] = branch
+                    source['repo'] = f'https://github.com/{repo}/{branch}'
+                    source['ogRepo'] = repo
+                else:
+                    if 'repo' in service_overrides:
+                        source['repo'] = service_overrides['repo']
+                    if 'branch' in service_overrides:
+                        source['branch'] = service_overrides['branch']
             
-        time.sleep(1)
+            if 'name' in service_overrides:
+                service_info['name'] = service_overrides['name']
+            
+            if service_overrides.get('serverless'):
+                service_info['deploy'] = dict(service_info.get('deploy', {}))
+                service_info['deploy']['sleepApplication'] = True
+            
+            services[service_id] = service_info
+        
+        configs[project] = {**base_config, 'services': services}
     
-    print("All services have started to deploy!")
-    return template_services
\ No newline at end of file
+    return configs
\ No newline at end of file